@@ -1,4 +1,6 @@
 import ctypes
+import ctypes.wintypes
+import struct
 from enum import Enum
 
 
@@ -7,6 +9,55 @@ kernel32 = ctypes.windll.kernel32
 gdi32 = ctypes.windll.gdi32
 ntdll = ctypes.windll.ntdll
 
+# ctypes.windll's function objects are shared with the whole process, so functions
+# that get argtypes/restype are prototyped on these separate handles instead
+typed_user32 = ctypes.WinDLL("user32")
+
+typed_user32.PostMessageW.argtypes = [
+    ctypes.wintypes.HWND,
+    ctypes.wintypes.UINT,
+    ctypes.wintypes.WPARAM,
+    ctypes.wintypes.LPARAM,
+]
+typed_user32.PostMessageW.restype = ctypes.wintypes.BOOL
+typed_user32.SendMessageTimeoutW.argtypes = [
+    ctypes.wintypes.HWND,
+    ctypes.wintypes.UINT,
+    ctypes.wintypes.WPARAM,
+    ctypes.wintypes.LPARAM,
+    ctypes.wintypes.UINT,
+    ctypes.wintypes.UINT,
+    ctypes.POINTER(ctypes.c_size_t),
+]
+typed_user32.SendMessageTimeoutW.restype = ctypes.wintypes.LPARAM
+typed_user32.ClientToScreen.argtypes = [
+    ctypes.wintypes.HWND,
+    ctypes.POINTER(ctypes.wintypes.POINT),
+]
+typed_user32.ClientToScreen.restype = ctypes.wintypes.BOOL
+
+typed_kernel32 = ctypes.WinDLL("kernel32")
+
+typed_kernel32.GetProcessTimes.argtypes = [
+    ctypes.wintypes.HANDLE,
+    ctypes.POINTER(ctypes.wintypes.FILETIME),
+    ctypes.POINTER(ctypes.wintypes.FILETIME),
+    ctypes.POINTER(ctypes.wintypes.FILETIME),
+    ctypes.POINTER(ctypes.wintypes.FILETIME),
+]
+typed_kernel32.GetProcessTimes.restype = ctypes.wintypes.BOOL
+
+typed_ntdll = ctypes.WinDLL("ntdll")
+
+typed_ntdll.NtReadVirtualMemory.argtypes = [
+    ctypes.wintypes.HANDLE,
+    ctypes.wintypes.LPCVOID,
+    ctypes.wintypes.LPVOID,
+    ctypes.c_size_t,
+    ctypes.POINTER(ctypes.c_size_t),
+]
+typed_ntdll.NtReadVirtualMemory.restype = ctypes.c_long
+
 
 # Number of units covered in 1 second
 WIZARD_SPEED = 580
@@ -29,6 +80,12 @@ type_format_dict = {
     "double": "<d",
 }
 
+# computed once so readers don't struct.calcsize the format on every call
+type_size_dict = {
+    data_type: struct.calcsize(type_format)
+    for data_type, type_format in type_format_dict.items()
+}
+
 
 # noinspection PyPep8
 class Keycode(Enum):
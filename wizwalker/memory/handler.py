@@ -117,6 +117,9 @@ class HookHandler(MemoryReader):
         self._autobot_address = None
         self._base_addrs = {}
 
+        # the process may keep running but nothing cached for it is used anymore
+        self._clear_process_caches()
+
     async def _check_for_autobot(self):
         if self._autobot_lock is None:
             self._autobot_lock = asyncio.Lock()
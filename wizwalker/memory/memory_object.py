@@ -1,8 +1,9 @@
+import ctypes
 import struct
 from enum import Enum
 from typing import Any, List, Type
 
-from wizwalker.constants import type_format_dict
+from wizwalker.constants import type_format_dict, type_size_dict
 from wizwalker.errors import (
     AddressOutOfRange,
     MemoryReadError,
@@ -18,6 +19,43 @@ from .memory_reader import MemoryReader
 MAX_STRING = 5_000
 
 
+class _StdStringData(ctypes.Union):
+    _fields_ = [
+        ("inline", ctypes.c_ubyte * 16),
+        ("pointer", ctypes.c_longlong),
+    ]
+
+
+class _StdString(ctypes.Structure):
+    # data is inline until it's too big, then it's a pointer
+    _anonymous_ = ("data",)
+    _fields_ = [
+        ("data", _StdStringData),
+        ("length", ctypes.c_int),
+    ]
+
+
+class _StdListNode(ctypes.Structure):
+    _fields_ = [
+        ("next", ctypes.c_longlong),
+        ("previous", ctypes.c_longlong),
+        ("value", ctypes.c_longlong),
+    ]
+
+
+class _StdMapNode(ctypes.Structure):
+    # some keys may be smaller but the entire 8 bytes seemed to always be reserved
+    _fields_ = [
+        ("left", ctypes.c_ulonglong),
+        ("parent", ctypes.c_ulonglong),
+        ("right", ctypes.c_ulonglong),
+        ("color", ctypes.c_char),
+        ("is_leaf", ctypes.c_bool),
+        ("key", ctypes.c_ulonglong),
+        ("mapped_data", ctypes.c_ulonglong),
+    ]
+
+
 # TODO: add .find_instances that find instances of whichever class used it
 class MemoryObject(MemoryReader):
     """
@@ -86,7 +124,8 @@ class MemoryObject(MemoryReader):
         return string_bytes.decode(encoding)
 
     async def read_wide_string(self, address: int, encoding: str = "utf-16") -> str:
-        string_len = await self.read_typed(address + 16, "int")
+        std_string = await self.read_struct(address, _StdString)
+        string_len = std_string.length
         if string_len == 0:
             return ""
 
@@ -95,12 +134,12 @@ class MemoryObject(MemoryReader):
 
         # wide strings larger than 8 bytes are pointers
         if string_len >= 8:
-            string_address = await self.read_typed(address, "long long")
+            string_bytes = await self.read_bytes(std_string.pointer, string_len)
         else:
-            string_address = address
+            string_bytes = bytes(std_string.inline)[:string_len]
 
         try:
-            return (await self.read_bytes(string_address, string_len)).decode(encoding)
+            return string_bytes.decode(encoding)
         except UnicodeDecodeError:
             return ""
 
@@ -148,19 +187,20 @@ class MemoryObject(MemoryReader):
         await self.write_wide_string(base_address + offset, string, encoding)
 
     async def read_string(self, address: int, encoding: str = "utf-8") -> str:
-        string_len = await self.read_typed(address + 16, "int")
+        std_string = await self.read_struct(address, _StdString)
+        string_len = std_string.length
 
         if not 1 <= string_len <= MAX_STRING:
             return ""
 
         # strings larger than 16 bytes are pointers
         if string_len >= 16:
-            string_address = await self.read_typed(address, "long long")
+            string_bytes = await self.read_bytes(std_string.pointer, string_len)
         else:
-            string_address = address
+            string_bytes = bytes(std_string.inline)[:string_len]
 
         try:
-            return (await self.read_bytes(string_address, string_len)).decode(encoding)
+            return string_bytes.decode(encoding)
         except UnicodeDecodeError:
             return ""
 
@@ -207,7 +247,7 @@ class MemoryObject(MemoryReader):
     # todo: rework this into from_offset and add read_vector which takes an address
     async def read_vector(self, offset: int, size: int = 3, data_type: str = "float"):
         type_str = type_format_dict[data_type].replace("<", "")
-        size_per_type = struct.calcsize(type_str)
+        size_per_type = type_size_dict[data_type]
 
         base_address = await self.read_base_address()
         vector_bytes = await self.read_bytes(
@@ -285,7 +325,7 @@ class MemoryObject(MemoryReader):
         return pointers
 
     async def read_dynamic_vector(
-        self, offset: int, data_type: str = "long long"
+        self, offset: int, data_type: str = "long long", *, max_size: int = 1000
     ) -> List[int]:
         """
         Read a vector that changes in size
@@ -293,22 +333,24 @@ class MemoryObject(MemoryReader):
         start_address = await self.read_value_from_offset(offset, "long long")
         end_address = await self.read_value_from_offset(offset + 8, "long long")
 
-        type_str = type_format_dict[data_type].replace("<", "")
-        size_per_type = struct.calcsize(type_str)
+        size_per_type = type_size_dict[data_type]
 
         size = (end_address - start_address) // size_per_type
 
-        if size == 0:
+        # empty or dealloc
+        if size <= 0:
             return []
 
-        current_address = start_address
-        pointers = []
-        for _ in range(size):
-            pointers.append(await self.read_typed(current_address, data_type))
+        if size > max_size:
+            raise ValueError(f"Size was {size} and the max was {max_size}")
 
-            current_address += size_per_type
+        # the elements are contiguous so they're read in one go
+        vector_bytes = await self.read_bytes(start_address, size * size_per_type)
 
-        return pointers
+        return [
+            value
+            for value, in struct.iter_unpack(type_format_dict[data_type], vector_bytes)
+        ]
 
     async def read_inlined_vector(
             self,
@@ -340,9 +382,9 @@ class MemoryObject(MemoryReader):
         list_size = await self.read_value_from_offset(offset + 8, "int")
 
         for i in range(list_size):
-            addr = await self.read_typed(next_node_addr + 16, "long long")
-            addrs.append(addr)
-            next_node_addr = await self.read_typed(next_node_addr, "long long")
+            node = await self.read_struct(next_node_addr, _StdListNode)
+            addrs.append(node.value)
+            next_node_addr = node.next
 
         return addrs
 
@@ -365,19 +407,18 @@ class MemoryObject(MemoryReader):
         return addrs
 
     async def _get_std_map_children(self, node, mapped_type, mapped_return):
-        # some keys may be smaller but the entire 8 bytes seemed to always be reserved
-        key = await self.read_typed(node + 0x20, "unsigned long long")
-        mapped_data = await self.read_typed(node + 0x28, "unsigned long long")
+        map_node = await self.read_struct(node, _StdMapNode)
 
-        mapped_return[key] = mapped_type(self.hook_handler, mapped_data)
+        mapped_return[map_node.key] = mapped_type(
+            self.hook_handler, map_node.mapped_data
+        )
 
-        is_leaf = await self.read_typed(node + 0x19, "bool")
-        if not is_leaf:
-            if left_node := await self.read_typed(node, "unsigned long long"):
-                await self._get_std_map_children(left_node, mapped_return)
+        if not map_node.is_leaf:
+            if left_node := map_node.left:
+                await self._get_std_map_children(left_node, mapped_type, mapped_return)
 
-            if right_node := await self.read_typed(node + 0x10, "unsigned long long"):
-                await self._get_std_map_children(right_node, mapped_return)
+            if right_node := map_node.right:
+                await self._get_std_map_children(right_node, mapped_type, mapped_return)
 
     # TODO: 2.0 replace this with complex memory read type
     #  class StdMap(MemoryComplex):
@@ -8,7 +8,14 @@ from wizwalker.memory.memory_object import DynamicMemoryObject, PropertyClass
 from .enums import WindowFlags, WindowStyle
 from .spell import DynamicGraphicalSpell
 from .combat_participant import DynamicCombatParticipant
-from wizwalker import AddressOutOfRange, MemoryReadError, Rectangle, utils, type_format_dict
+from wizwalker import (
+    AddressOutOfRange,
+    MemoryReadError,
+    Rectangle,
+    utils,
+    type_format_dict,
+    type_size_dict,
+)
 
 
 # TODO: Window.click
@@ -304,7 +311,7 @@ class SpellListControlSpellEntry(DynamicMemoryObject):
 
     async def _read_vector(self, address: int, size: int = 3, data_type: str = "float"):
         type_str = type_format_dict[data_type].replace("<", "")
-        size_per_type = struct.calcsize(type_str)
+        size_per_type = type_size_dict[data_type]
 
         vector_bytes = await self.read_bytes(
             address, size_per_type * size
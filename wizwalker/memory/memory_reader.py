@@ -1,8 +1,18 @@
+import array
 import asyncio
+import collections
+import ctypes
+import ctypes.wintypes
 import functools
+import itertools
+import os
 import regex
 import struct
-from typing import Any, Union
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple, Type, Union
 
 import pefile
 import pymem
@@ -10,6 +20,11 @@ import pymem.exception
 import pymem.process
 import pymem.ressources.structure
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 from wizwalker import (
     AddressOutOfRange,
     ClientClosedError,
@@ -20,6 +35,139 @@ from wizwalker import (
     type_format_dict,
     utils,
 )
+from wizwalker.constants import kernel32, typed_kernel32, typed_ntdll
+
+
+# used instead of the default executor so hooking many clients doesn't grow the thread count
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="wizwalker-io")
+_SCAN_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count(), thread_name_prefix="wizwalker-scan"
+)
+_scan_thread_local = threading.local()
+
+# reads this size or smaller go through a per thread buffer instead of a new one
+_READ_SCRATCH_SIZE = 4096
+_read_thread_local = threading.local()
+
+# precompiled so the format string isn't reparsed on every read/write
+_STRUCT_CACHE = {
+    data_type: struct.Struct(type_format)
+    for data_type, type_format in type_format_dict.items()
+}
+# regions are scanned in chunks of this size so reads overlap with scans
+_SCAN_CHUNK_SIZE = 1024 * 1024
+# reads up to a chunk plus its pattern overlap go into a per thread buffer that's
+# reused between scans; bigger ones get their own so they aren't kept alive
+_SCAN_BUFFER_MAX_SIZE = _SCAN_CHUNK_SIZE + 4096
+# seconds a walk of the committed regions is reused for; the game allocates
+# and frees memory on its own so this can't be cached forever
+_REGION_CACHE_TTL = 5.0
+# addresses closer than this are read with one read_bytes in read_typed_many
+_READ_MANY_MAX_GAP = 4096
+
+# how many parsed patterns and hyperscan databases are kept; instance finding
+# makes a new pattern per address so these can't grow forever
+_PATTERN_CACHE_SIZE = 256
+# hyperscan scratches kept per scan thread, each is only valid for its database
+_HYPERSCAN_SCRATCH_CACHE_SIZE = 16
+
+# bytes that make a pattern more than a plain array of bytes with . wildcards
+_REGEX_METACHARACTERS = frozenset(b"[](){}?*+|^$")
+_HEX_DIGITS = frozenset(b"0123456789abcdefABCDEF")
+
+
+def _get_read_scratch() -> Tuple[ctypes.Array, memoryview]:
+    try:
+        return _read_thread_local.scratch
+    except AttributeError:
+        buffer = bytearray(_READ_SCRATCH_SIZE)
+        scratch = _read_thread_local.scratch = (
+            (ctypes.c_char * _READ_SCRATCH_SIZE).from_buffer(buffer),
+            memoryview(buffer),
+        )
+        return scratch
+
+
+@functools.lru_cache(maxsize=_PATTERN_CACHE_SIZE)
+def _tokenize_aob(pattern: bytes) -> Optional[Tuple[Optional[int], ...]]:
+    """
+    Convert an array of bytes pattern into a tuple of bytes with None for . wildcards
+
+    Returns:
+        The tokens or None if the pattern uses any other regex syntax
+    """
+    tokens = []
+    index = 0
+
+    while index < len(pattern):
+        char = pattern[index]
+
+        if char == ord("\\"):
+            escaped = pattern[index + 1 : index + 2]
+            if escaped == b"x" and len(pattern) >= index + 4 and all(
+                c in _HEX_DIGITS for c in pattern[index + 2 : index + 4]
+            ):
+                tokens.append(int(pattern[index + 2 : index + 4], 16))
+                index += 4
+            elif escaped and not escaped.isalnum():
+                tokens.append(escaped[0])
+                index += 2
+            else:
+                return None
+
+        elif char == ord("."):
+            tokens.append(None)
+            index += 1
+
+        elif char in _REGEX_METACHARACTERS:
+            return None
+
+        else:
+            tokens.append(char)
+            index += 1
+
+    return tuple(tokens)
+
+
+@functools.lru_cache(maxsize=_PATTERN_CACHE_SIZE)
+def _parse_aob(
+    pattern: bytes,
+) -> Optional[Tuple[bytes, int, Tuple[Tuple[int, bytes], ...], int]]:
+    """
+    Split an array of bytes pattern into its longest literal run and the
+    (offset, literal run) checks for the rest of it, wildcards are skipped
+
+    Returns:
+        (anchor, anchor offset, checks, length) or None if the pattern uses
+        any other regex syntax or has no literal bytes
+    """
+    if (tokens := _tokenize_aob(pattern)) is None:
+        return None
+
+    runs = []
+    run_start = None
+    for offset in range(len(tokens) + 1):
+        if offset < len(tokens) and tokens[offset] is not None:
+            if run_start is None:
+                run_start = offset
+
+        elif run_start is not None:
+            runs.append((run_start, bytes(tokens[run_start:offset])))
+            run_start = None
+
+    if not runs:
+        return None
+
+    # the longest run gives bytes.find the fewest false candidates and
+    # lets patterns that start with wildcards skip regex entirely
+    anchor_offset, anchor = max(runs, key=lambda run: len(run[1]))
+    runs.remove((anchor_offset, anchor))
+
+    # the run with the last byte is checked first so a candidate is
+    # rejected on its edges before anything in between
+    checks = tuple(runs[-1:] + runs[:-1])
+
+    return anchor, anchor_offset, checks, len(tokens)
 
 
 class MemoryReader:
@@ -27,10 +175,26 @@ class MemoryReader:
     Represents anything that needs to read/write from/to memory
     """
 
+    # pattern: compiled hyperscan database, shared since the same patterns are scanned
+    # repeatedly; least recently used first
+    _hyperscan_databases = collections.OrderedDict()
+    # scan threads compile patterns so the lru updates need a lock
+    _hyperscan_databases_lock = threading.Lock()
+    # the process caches below are keyed by (process id, creation time) since
+    # process ids are reused once a process exits
+    # (process key, module, pattern): array of found addresses; module code doesn't
+    # change so only module scans are cached
+    _pattern_cache = {}
+    # (process key, module name): module info
+    _module_cache = {}
+    # (process key, start, end): (time walked, readable regions)
+    _region_cache = {}
+
     def __init__(self, process: pymem.Pymem):
         self.process = process
 
         self._symbol_table = {}
+        self._process_key = None
 
     # TODO: 2.0 make this a property
     def is_running(self) -> bool:
@@ -39,6 +203,53 @@ class MemoryReader:
         """
         return utils.check_if_process_running(self.process.process_handle)
 
+    def _get_process_key(self) -> Tuple[int, int]:
+        if self._process_key is None:
+            creation_time = ctypes.wintypes.FILETIME()
+            # only the creation time is wanted but all of them have to be passed
+            unused_times = [ctypes.wintypes.FILETIME() for _ in range(3)]
+
+            if not typed_kernel32.GetProcessTimes(
+                self.process.process_handle,
+                ctypes.byref(creation_time),
+                *(ctypes.byref(unused_time) for unused_time in unused_times),
+            ):
+                # not cached so a later call can still get the real key
+                return self.process.process_id, 0
+
+            self._process_key = (
+                self.process.process_id,
+                creation_time.dwHighDateTime << 32 | creation_time.dwLowDateTime,
+            )
+
+        return self._process_key
+
+    def _clear_process_caches(self):
+        process_key = self._get_process_key()
+
+        for cache in (self._pattern_cache, self._module_cache, self._region_cache):
+            for key in [key for key in cache if key[0] == process_key]:
+                del cache[key]
+
+    def _invalidate_region_cache(self):
+        process_key = self._get_process_key()
+
+        for key in [key for key in self._region_cache if key[0] == process_key]:
+            del self._region_cache[key]
+
+    def _get_module(self, module_name: str):
+        key = (self._get_process_key(), module_name)
+
+        if (module := self._module_cache.get(key)) is None:
+            module = pymem.process.module_from_name(
+                self.process.process_handle, module_name
+            )
+
+            if module is not None:
+                self._module_cache[key] = module
+
+        return module
+
     @staticmethod
     async def run_in_executor(func, *args, **kwargs):
         """
@@ -52,7 +263,7 @@ class MemoryReader:
         loop = asyncio.get_event_loop()
         function = functools.partial(func, *args, **kwargs)
 
-        return await loop.run_in_executor(None, function)
+        return await loop.run_in_executor(_IO_POOL, function)
 
     def _get_symbols(self, file_path: str, *, force_reload: bool = False):
         if (dll_table := self._symbol_table.get(file_path)) and not force_reload:
@@ -73,67 +284,391 @@ class MemoryReader:
         self._symbol_table[file_path] = symbols
         return symbols
 
+    @classmethod
+    def _compile_pattern(cls, pattern: bytes):
+        """
+        Compile an array of bytes pattern into a hyperscan database
+
+        Returns:
+            The database or None if hyperscan isn't installed or the pattern isn't
+            a plain array of bytes
+        """
+        if hyperscan is None:
+            return None
+
+        with cls._hyperscan_databases_lock:
+            try:
+                cls._hyperscan_databases.move_to_end(pattern)
+                return cls._hyperscan_databases[pattern]
+            except KeyError:
+                pass
+
+        if not (tokens := _tokenize_aob(pattern)):
+            database = None
+
+        else:
+            # raw bytes (including nulls) aren't safe in a hyperscan expression
+            expression = b"".join(
+                b"." if token is None else b"\\x%02X" % token for token in tokens
+            )
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[expression],
+                flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_DOTALL],
+            )
+
+        with cls._hyperscan_databases_lock:
+            cls._hyperscan_databases[pattern] = database
+
+            while len(cls._hyperscan_databases) > _PATTERN_CACHE_SIZE:
+                cls._hyperscan_databases.popitem(last=False)
+
+        return database
+
+    @staticmethod
+    def _get_hyperscan_scratch(database):
+        # a database's own scratch can only be used by one thread at a time and
+        # hyperscan's python bindings can't grow a scratch for another database,
+        # so each thread keeps a few; keyed by the database itself so an evicted
+        # and recompiled pattern doesn't reuse a scratch that isn't its own
+        try:
+            scratches = _scan_thread_local.hyperscan_scratches
+        except AttributeError:
+            scratches = _scan_thread_local.hyperscan_scratches = (
+                collections.OrderedDict()
+            )
+
+        if (scratch := scratches.get(database)) is None:
+            scratch = scratches[database] = hyperscan.Scratch(database)
+
+            while len(scratches) > _HYPERSCAN_SCRATCH_CACHE_SIZE:
+                scratches.popitem(last=False)
+
+        else:
+            scratches.move_to_end(database)
+
+        return scratch
+
+    @staticmethod
+    def _on_hyperscan_match(_id, start, end, _flags, context):
+        found, address, last_end, max_results = context
+        # hyperscan reports overlapping matches; finditer doesn't
+        if start >= last_end[0]:
+            found.append(address + start)
+            last_end[0] = end
+
+        # returning True stops the scan
+        return len(found) >= max_results
+
     @staticmethod
-    def _scan_page_return_all(handle, address, pattern):
-        mbi = pymem.memory.virtual_query(handle, address)
-        next_region = mbi.BaseAddress + mbi.RegionSize
+    def _get_readable_regions(
+        handle, start: int, end: int, merge: bool = True
+    ) -> List[Tuple[int, int]]:
+        """
+        Walk the committed, readable regions between start and end
+
+        Args:
+            merge: If adjacent regions should be merged into one run
+
+        Returns:
+            (base address, size) regions or runs of them
+        """
         allowed_protections = [
             pymem.ressources.structure.MEMORY_PROTECTION.PAGE_EXECUTE_READ,
             pymem.ressources.structure.MEMORY_PROTECTION.PAGE_EXECUTE_READWRITE,
             pymem.ressources.structure.MEMORY_PROTECTION.PAGE_READWRITE,
             pymem.ressources.structure.MEMORY_PROTECTION.PAGE_READONLY,
         ]
-        if (
-            mbi.state != pymem.ressources.structure.MEMORY_STATE.MEM_COMMIT
-            or mbi.protect not in allowed_protections
+
+        regions = []
+        next_region = start
+        while next_region < end:
+            mbi = pymem.memory.virtual_query(handle, next_region)
+            region_end = min(mbi.BaseAddress + mbi.RegionSize, end)
+
+            if (
+                mbi.state == pymem.ressources.structure.MEMORY_STATE.MEM_COMMIT
+                and mbi.protect in allowed_protections
+            ):
+                base_address = max(mbi.BaseAddress, next_region)
+
+                if merge and regions and sum(regions[-1]) == base_address:
+                    last_base, _ = regions[-1]
+                    regions[-1] = (last_base, region_end - last_base)
+                else:
+                    regions.append((base_address, region_end - base_address))
+
+            next_region = mbi.BaseAddress + mbi.RegionSize
+
+        return regions
+
+    @staticmethod
+    def _read_region(handle, address: int, size: int) -> Optional[bytearray]:
+        """
+        Read a whole region with one ReadProcessMemory call into this thread's
+        scan buffer; only the first size bytes of it belong to the region
+
+        Returns:
+            The buffer or None if the region couldn't be read (e.g. it was freed)
+        """
+        if size > _SCAN_BUFFER_MAX_SIZE:
+            buffer = bytearray(size)
+
+        else:
+            buffer = getattr(_scan_thread_local, "buffer", None)
+
+            # allocated at full size once so it never has to be replaced
+            if buffer is None:
+                buffer = _scan_thread_local.buffer = bytearray(_SCAN_BUFFER_MAX_SIZE)
+
+        if not kernel32.ReadProcessMemory(
+            ctypes.c_void_p(handle),
+            ctypes.c_void_p(address),
+            (ctypes.c_char * size).from_buffer(buffer),
+            ctypes.c_size_t(size),
+            None,
         ):
-            return next_region, None
+            return None
+
+        return buffer
+
+    @classmethod
+    def _scan_page_return_all(
+        cls,
+        handle,
+        address: int,
+        size: int,
+        pattern: bytes,
+        max_results: Optional[int] = None,
+        split_on_failure: bool = True,
+    ):
+        if max_results is None:
+            max_results = sys.maxsize
+
+        # page_bytes can be longer than the region; nothing past size is looked at
+        page_bytes = cls._read_region(handle, address, size)
+
+        # 8 bytes per address instead of a python int each; scans
+        # like every jmp in a module have a lot of results
+        found = array.array("Q")
+
+        if page_bytes is None:
+            if not split_on_failure:
+                return found
+
+            # part of a merged run was freed or reprotected since it was walked,
+            # so scan what's still readable of it one region at a time instead
+            for region_address, region_size in cls._get_readable_regions(
+                handle, address, address + size, merge=False
+            ):
+                found.extend(
+                    cls._scan_page_return_all(
+                        handle,
+                        region_address,
+                        region_size,
+                        pattern,
+                        max_results - len(found),
+                        split_on_failure=False,
+                    )
+                )
+
+                if len(found) >= max_results:
+                    break
+
+            return found
+
+        if (database := cls._compile_pattern(pattern)) is not None:
+            try:
+                database.scan(
+                    memoryview(page_bytes)[:size],
+                    match_event_handler=cls._on_hyperscan_match,
+                    context=(found, address, [0], max_results),
+                    scratch=cls._get_hyperscan_scratch(database),
+                )
+            except hyperscan.ScanTerminated:
+                pass
+
+            return found
+
+        if (parsed := _parse_aob(pattern)) is None:
+            for match in itertools.islice(
+                regex.finditer(pattern, page_bytes, regex.DOTALL, endpos=size),
+                max_results,
+            ):
+                found_address = address + match.span()[0]
+                found.append(found_address)
+
+            return found
+
+        # bytes.find is a C level memchr/fastsearch scan, so only candidates
+        # containing the anchor are checked in python; each check
+        # is a memcmp of a whole literal run
+        anchor, anchor_offset, checks, pattern_length = parsed
+        last_start = size - pattern_length
+        # bound once; verifying is the hot loop when the anchor is short
+        find = page_bytes.find
+        startswith = page_bytes.startswith
+        position = find(anchor, anchor_offset, size)
+
+        while position != -1 and (start := position - anchor_offset) <= last_start:
+            # a plain loop rather than all() over a generator, which costs
+            # several times more than the memcmps themselves
+            for offset, run in checks:
+                if not startswith(run, start + offset):
+                    position = find(anchor, position + 1, size)
+                    break
+
+            else:
+                found.append(address + start)
+                if len(found) >= max_results:
+                    break
+
+                # matches don't overlap; same as finditer
+                position = find(anchor, start + pattern_length + anchor_offset, size)
+
+        return found
+
+    async def _get_regions(self, handle, start: int, end: int) -> List[Tuple[int, int]]:
+        key = (self._get_process_key(), start, end)
+
+        if (cached := self._region_cache.get(key)) is not None:
+            walked_at, regions = cached
 
-        page_bytes = pymem.memory.read_bytes(handle, address, mbi.RegionSize)
+            if time.monotonic() - walked_at < _REGION_CACHE_TTL:
+                return regions
 
-        found = []
+        regions = await self.run_in_executor(
+            self._get_readable_regions, handle, start, end
+        )
+        self._region_cache[key] = (time.monotonic(), regions)
+        return regions
 
-        for match in regex.finditer(pattern, page_bytes, regex.DOTALL):
-            found_address = address + match.span()[0]
-            found.append(found_address)
+    @staticmethod
+    def _split_regions(
+        regions: List[Tuple[int, int]], pattern: bytes
+    ) -> List[Tuple[int, int, int]]:
+        """
+        Split regions into _SCAN_CHUNK_SIZE chunks so one big region is read and
+        scanned by several workers at once instead of reading all of it then scanning
 
-        return next_region, found
+        Each chunk is read pattern length - 1 bytes past its end, so a match can
+        only be found by the chunk it starts in
 
-    def _scan_all(
+        Returns:
+            (region index, address, size) chunks in address order
+        """
+        # a regex's match length isn't known so those can't be split
+        if not (tokens := _tokenize_aob(pattern)):
+            return [
+                (region_index, address, size)
+                for region_index, (address, size) in enumerate(regions)
+            ]
+
+        overlap = len(tokens) - 1
+
+        chunks = []
+        for region_index, (address, size) in enumerate(regions):
+            region_end = address + size
+
+            for chunk_address in range(address, region_end, _SCAN_CHUNK_SIZE):
+                chunk_end = min(chunk_address + _SCAN_CHUNK_SIZE + overlap, region_end)
+                chunks.append((region_index, chunk_address, chunk_end - chunk_address))
+
+        return chunks
+
+    async def _scan_regions(
         self,
         handle: int,
+        regions: List[Tuple[int, int]],
         pattern: bytes,
-        return_multiple: bool = False,
-    ):
-        next_region = 0
-
-        found = []
-        while next_region < 0x7FFFFFFF0000:
-            next_region, page_found = self._scan_page_return_all(
-                handle, next_region, pattern
+        stop_on_first: bool = False,
+    ) -> array.array:
+        loop = asyncio.get_event_loop()
+        chunks = self._split_regions(regions, pattern)
+        # a second result is all it takes to know a single result scan failed,
+        # so the rest of the region doesn't need to be scanned
+        max_results = 2 if stop_on_first else None
+        # ReadProcessMemory releases the gil so chunks are scanned in parallel
+        futures = [
+            loop.run_in_executor(
+                _SCAN_POOL,
+                self._scan_page_return_all,
+                handle,
+                address,
+                size,
+                pattern,
+                max_results,
             )
-            if page_found:
-                found += page_found
+            for _, address, size in chunks
+        ]
 
-            if not return_multiple and found:
-                break
+        found = array.array("Q")
+        # only set for patterns that can be split into chunks
+        next_allowed = 0
+        pattern_length = len(_tokenize_aob(pattern) or ())
+        last_region_index = None
 
-        return found
+        try:
+            # awaited in address order so the lowest region with a match wins no
+            # matter which scan finishes first
+            for (region_index, address, size), future in zip(chunks, futures):
+                # single result scans only look at the first region with a match;
+                # all of its chunks count towards it having more than one
+                if stop_on_first and found and region_index != last_region_index:
+                    break
+
+                last_region_index = region_index
+                chunk_found = await future
+
+                # the last match of the previous chunk ran into this one and
+                # overlaps its first match; finditer would've continued from the
+                # end of that match instead, so scan the chunk again from there
+                if chunk_found and chunk_found[0] < next_allowed:
+                    chunk_found = await loop.run_in_executor(
+                        _SCAN_POOL,
+                        self._scan_page_return_all,
+                        handle,
+                        next_allowed,
+                        address + size - next_allowed,
+                        pattern,
+                        max_results,
+                    )
+
+                found.extend(chunk_found)
+
+                if max_results is not None and len(found) >= max_results:
+                    return found[:max_results]
+
+                if chunk_found and pattern_length:
+                    next_allowed = chunk_found[-1] + pattern_length
+
+            return found
+
+        finally:
+            # chunks that haven't started yet are skipped
+            for future in futures:
+                future.cancel()
+
+    async def _scan_all(
+        self,
+        handle: int,
+        pattern: bytes,
+        return_multiple: bool = False,
+    ):
+        regions = await self._get_regions(handle, 0, 0x7FFFFFFF0000)
+
+        found = await self._scan_regions(
+            handle, regions, pattern, stop_on_first=not return_multiple
+        )
+        return found.tolist()
 
-    def _scan_entire_module(self, handle, module, pattern):
+    async def _scan_entire_module(self, handle, module, pattern):
         base_address = module.lpBaseOfDll
         max_address = module.lpBaseOfDll + module.SizeOfImage
-        page_address = base_address
 
-        found = []
-        while page_address < max_address:
-            page_address, page_found = self._scan_page_return_all(
-                handle, page_address, pattern
-            )
-            if page_found:
-                found += page_found
+        regions = await self._get_regions(handle, base_address, max_address)
 
-        return found
+        return await self._scan_regions(handle, regions, pattern)
 
     async def pattern_scan(
         self, pattern: bytes, *, module: str = None, return_multiple: bool = False
@@ -153,24 +688,33 @@ class MemoryReader:
         Returns:
             A list of results if return_multple is True otherwise one result
         """
-        if module:
-            module_object = pymem.process.module_from_name(self.process.process_handle, module)
+        cache_key = (self._get_process_key(), module, pattern)
+
+        if (cached := self._pattern_cache.get(cache_key)) is not None:
+            found_addresses = cached.tolist()
+
+        elif module:
+            module_object = self._get_module(module)
 
             if module_object is None:
                 raise ValueError(f"{module} module not found.")
 
-            # this can take a long time to run when collecting multiple results
-            # so must be run in an executor
-            found_addresses = await self.run_in_executor(
-                self._scan_entire_module,
+            # the actual scanning is done in _SCAN_POOL so the event loop isn't blocked
+            found = await self._scan_entire_module(
                 self.process.process_handle,
                 module_object,
                 pattern,
             )
 
+            # kept as the array so scans with a lot of results, like every jmp in
+            # the exe, are cached at 8 bytes an address instead of a python int each
+            if found:
+                self._pattern_cache[cache_key] = found
+
+            found_addresses = found.tolist()
+
         else:
-            found_addresses = await self.run_in_executor(
-                self._scan_all,
+            found_addresses = await self._scan_all(
                 self.process.process_handle,
                 pattern,
                 return_multiple,
@@ -223,9 +767,7 @@ class MemoryReader:
         if not (symbol := symbols.get(symbol_name)):
             raise ValueError(f"No symbol named {symbol_name} in module {module_name}")
 
-        module = pymem.process.module_from_name(
-            self.process.process_handle, module_name
-        )
+        module = self._get_module(module_name)
 
         return module.lpBaseOfDll + symbol
 
@@ -239,6 +781,7 @@ class MemoryReader:
         Returns:
             The allocated address
         """
+        self._invalidate_region_cache()
         return self.process.allocate(size)
 
     async def free(self, address: int):
@@ -248,6 +791,7 @@ class MemoryReader:
         Args:
              address: The address to free
         """
+        self._invalidate_region_cache()
         self.process.free(address)
 
     # TODO: figure out how params works
@@ -260,6 +804,25 @@ class MemoryReader:
         """
         await self.run_in_executor(self.process.start_thread, address)
 
+    def _read_into(self, address: int, size: int, buffer):
+        if not 0 < address <= 0x7FFFFFFFFFFFFFFF:
+            raise AddressOutOfRange(address)
+
+        # reads go straight to ntdll instead of through pymem's ReadProcessMemory
+        status = typed_ntdll.NtReadVirtualMemory(
+            self.process.process_handle, address, buffer, size, None
+        )
+
+        # negative NTSTATUS is an error, this includes partial copies
+        if status < 0:
+            # we don't want to run is running for every read
+            # so we just check after we error
+            if not self.is_running():
+                self._clear_process_caches()
+                raise ClientClosedError()
+            else:
+                raise MemoryReadError(address)
+
     async def read_bytes(self, address: int, size: int) -> bytes:
         """
         Read some bytes from memory
@@ -273,18 +836,14 @@ class MemoryReader:
             MemoryReadError: If there was an error reading memory
             AddressOutOfRange: If the addrress is out of bounds
         """
-        if not 0 < address <= 0x7FFFFFFFFFFFFFFF:
-            raise AddressOutOfRange(address)
+        if size <= _READ_SCRATCH_SIZE:
+            buffer, scratch = _get_read_scratch()
+            self._read_into(address, size, buffer)
+            return bytes(scratch[:size])
 
-        try:
-            return self.process.read_bytes(address, size)
-        except pymem.exception.MemoryReadError:
-            # we don't want to run is running for every read
-            # so we just check after we error
-            if not self.is_running():
-                raise ClientClosedError()
-            else:
-                raise MemoryReadError(address)
+        buffer = ctypes.create_string_buffer(size)
+        self._read_into(address, size, buffer)
+        return buffer.raw
 
     async def write_bytes(self, address: int, value: bytes):
         """
@@ -301,6 +860,7 @@ class MemoryReader:
         except pymem.exception.MemoryWriteError:
             # see read_bytes
             if not self.is_running():
+                self._clear_process_caches()
                 raise ClientClosedError()
             else:
                 raise MemoryWriteError(address)
@@ -316,12 +876,88 @@ class MemoryReader:
         Returns:
             The converted data type
         """
-        type_format = type_format_dict.get(data_type)
-        if type_format is None:
+        type_struct = _STRUCT_CACHE.get(data_type)
+        if type_struct is None:
+            raise ValueError(f"{data_type} is not a valid data type")
+
+        # unpacked straight from the scratch buffer; no bytes object per read
+        buffer, scratch = _get_read_scratch()
+        self._read_into(address, type_struct.size, buffer)
+        return type_struct.unpack_from(scratch)[0]
+
+    async def read_typed_many(self, addresses: List[int], data_type: str) -> List[Any]:
+        """
+        Read typed bytes from many addresses, addresses close to each other
+        are read together
+
+        Args:
+            addresses: The addresses to read from
+            data_type: The type to read (defined in constants)
+
+        Returns:
+            The converted data types in the same order as addresses
+        """
+        type_struct = _STRUCT_CACHE.get(data_type)
+        if type_struct is None:
             raise ValueError(f"{data_type} is not a valid data type")
 
-        data = await self.read_bytes(address, struct.calcsize(type_format))
-        return struct.unpack(type_format, data)[0]
+        sorted_addresses = sorted(set(addresses))
+        values = {}
+
+        run_start = 0
+        for index in range(1, len(sorted_addresses) + 1):
+            if (
+                index < len(sorted_addresses)
+                and sorted_addresses[index] - sorted_addresses[index - 1]
+                < _READ_MANY_MAX_GAP
+            ):
+                continue
+
+            run = sorted_addresses[run_start:index]
+            run_start = index
+
+            base_address = run[0]
+            span = run[-1] + type_struct.size - base_address
+
+            try:
+                data = await self.read_bytes(base_address, span)
+            except MemoryReadError:
+                # the gap between two addresses wasn't readable
+                for address in run:
+                    values[address] = await self.read_typed(address, data_type)
+
+                continue
+
+            # fully contiguous; decode the whole run at once
+            contiguous = range(base_address, base_address + span, type_struct.size)
+            if run == list(contiguous):
+                values.update(
+                    zip(run, (value for value, in type_struct.iter_unpack(data)))
+                )
+
+            else:
+                for address in run:
+                    values[address] = type_struct.unpack_from(
+                        data, address - base_address
+                    )[0]
+
+        return [values[address] for address in addresses]
+
+    async def read_struct(
+        self, address: int, struct_type: Type[ctypes.Structure]
+    ) -> ctypes.Structure:
+        """
+        Read a ctypes structure from memory with one read
+
+        Args:
+            address: The address to read from
+            struct_type: The ctypes.Structure subclass to read
+
+        Returns:
+            A copy of the structure
+        """
+        data = await self.read_bytes(address, ctypes.sizeof(struct_type))
+        return struct_type.from_buffer_copy(data)
 
     async def write_typed(self, address: int, value: Any, data_type: str):
         """
@@ -332,9 +968,9 @@ class MemoryReader:
             value: The value to convert and then write
             data_type: The data type to convert to
         """
-        type_format = type_format_dict.get(data_type)
-        if type_format is None:
+        type_struct = _STRUCT_CACHE.get(data_type)
+        if type_struct is None:
             raise ValueError(f"{data_type} is not a valid data type")
 
-        packed_data = struct.pack(type_format, value)
+        packed_data = type_struct.pack(value)
         await self.write_bytes(address, packed_data)
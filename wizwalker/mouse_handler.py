@@ -1,9 +1,17 @@
 import asyncio
 import ctypes
 import ctypes.wintypes
+from collections import deque
 
 import wizwalker
-from wizwalker import user32
+from wizwalker import typed_user32
+from wizwalker.memory import MemoryReader
+
+
+SMTO_ABORTIFHUNG = 0x2
+# milliseconds to wait on the client to handle a sent message; long enough for
+# a busy client but a hung one won't hold an executor thread forever
+SEND_MESSAGE_TIMEOUT = 500
 
 
 class MouseHandler:
@@ -13,7 +21,76 @@ class MouseHandler:
 
     def __init__(self, client: "wizwalker.Client"):
         self.client = client
-        self.click_lock = None
+
+        # a click in progress and the clicks waiting on it; no future is made
+        # unless a click actually has to wait
+        self._click_busy = False
+        self._click_waiters = deque()
+
+        # reused for ClientToScreen conversions
+        self._point = ctypes.wintypes.POINT()
+
+    async def _acquire_click(self):
+        if not self._click_busy:
+            self._click_busy = True
+            return
+
+        # futures can't be created in __init__ since MouseHandler is inited in sync funcs
+        waiter = asyncio.get_event_loop().create_future()
+        self._click_waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # cancelled after the click was handed to us
+            if waiter.done() and not waiter.cancelled():
+                self._release_click()
+            elif waiter in self._click_waiters:
+                self._click_waiters.remove(waiter)
+
+            raise
+
+    def _release_click(self):
+        while self._click_waiters:
+            waiter = self._click_waiters.popleft()
+
+            if not waiter.done():
+                # hand the click straight to the next waiter; _click_busy stays set
+                waiter.set_result(None)
+                return
+
+        self._click_busy = False
+
+    @staticmethod
+    def _send_messages(window_handle: int, messages: tuple):
+        result = ctypes.c_size_t()
+
+        for message, wparam, lparam in messages:
+            typed_user32.SendMessageTimeoutW(
+                window_handle,
+                message,
+                wparam,
+                lparam,
+                SMTO_ABORTIFHUNG,
+                SEND_MESSAGE_TIMEOUT,
+                ctypes.byref(result),
+            )
+
+    async def _dispatch_messages(self, *messages, use_post: bool = False):
+        """
+        Send or post (message, wparam, lparam) messages to the client window in order
+        """
+        if use_post:
+            for message, wparam, lparam in messages:
+                typed_user32.PostMessageW(
+                    self.client.window_handle, message, wparam, lparam
+                )
+
+        else:
+            # SendMessage blocks until the client handles it so it can't be on the event loop
+            await MemoryReader.run_in_executor(
+                self._send_messages, self.client.window_handle, messages
+            )
 
     async def activate_mouseless(self):
         """
@@ -105,27 +182,32 @@ class MouseHandler:
         else:
             button_down_message = 0x201
 
-        if use_post:
-            send_method = user32.PostMessageW
-        else:
-            send_method = user32.SendMessageW
-
-        # so MouseHandler can be inited in sync funcs like other __init__s
-        if self.click_lock is None:
-            self.click_lock = asyncio.Lock()
-
         # prevent multiple clicks from happening at the same time
-        async with self.click_lock:
+        await self._acquire_click()
+        try:
             # TODO: test passing use_post
             await self.set_mouse_position(x, y)
-            # mouse button down
-            send_method(self.client.window_handle, button_down_message, 1, 0)
             if sleep_duration > 0:
+                # mouse button down
+                await self._dispatch_messages(
+                    (button_down_message, 1, 0), use_post=use_post
+                )
                 await asyncio.sleep(sleep_duration)
-            # mouse button up
-            send_method(self.client.window_handle, button_down_message + 1, 0, 0)
+                # mouse button up
+                await self._dispatch_messages(
+                    (button_down_message + 1, 0, 0), use_post=use_post
+                )
+            else:
+                # mouse button down and up in one executor call
+                await self._dispatch_messages(
+                    (button_down_message, 1, 0),
+                    (button_down_message + 1, 0, 0),
+                    use_post=use_post,
+                )
             # move mouse outside of client area
             await self.set_mouse_position(-100, -100)
+        finally:
+            self._release_click()
 
     async def set_mouse_position(
         self,
@@ -145,17 +227,16 @@ class MouseHandler:
             convert_from_client: If the position should be converted from client to screen
             use_post: If PostMessage should be used instead of SendMessage
         """
-        if use_post:
-            send_method = user32.PostMessageW
-        else:
-            send_method = user32.SendMessageW
-
         if convert_from_client:
-            point = ctypes.wintypes.tagPOINT(x, y)
+            point = self._point
+            point.x = x
+            point.y = y
 
             # https://docs.microsoft.com/en-us/windows/win32/api/winuser/nf-winuser-clienttoscreen
             if (
-                user32.ClientToScreen(self.client.window_handle, ctypes.byref(point))
+                typed_user32.ClientToScreen(
+                    self.client.window_handle, ctypes.byref(point)
+                )
                 == 0
             ):
                 raise RuntimeError("Client to screen conversion failed")
@@ -168,5 +249,5 @@ class MouseHandler:
         res = await self.client.hook_handler.write_mouse_position(x, y)
         # position doesn't matter here; sending mouse move
         # mouse move is here so that items are highlighted
-        send_method(self.client.window_handle, 0x200, 0, 0)
+        await self._dispatch_messages((0x200, 0, 0), use_post=use_post)
         return res